@@ -0,0 +1,115 @@
+from tensorflow.keras import layers, models
+from tensorflow.keras import regularizers
+from tensorflow.keras.layers import Input, Add, ReLU, BatchNormalization, Conv2D, MaxPooling2D, AveragePooling2D, Flatten, Dense, Dropout
+from tensorflow.keras.models import Model
+
+
+# Fungsi untuk membuat dan mengompilasi model CNN
+# kernel_size (3, 3) dipakai SPLIT VALIDATION.PY, (5, 5) dipakai K-FOLD CROSS VALIDATION.PY
+def build_cnn(img_height, img_width, kernel_size=(3, 3), num_classes=3):
+    # Langkah 1: Definisikan arsitektur model CNN
+    model = models.Sequential([
+        layers.Conv2D(32, kernel_size, activation='relu', input_shape=(img_height, img_width, 3)),
+        layers.MaxPooling2D((2, 2)),
+        layers.Conv2D(64, kernel_size, activation='relu'),
+        layers.MaxPooling2D((2, 2)),
+        layers.Conv2D(128, kernel_size, activation='relu'),
+        layers.MaxPooling2D((2, 2)),
+        layers.Flatten(),
+        layers.Dense(128, activation='relu', kernel_regularizer=regularizers.l2(0.01)),  # L2 regularization
+        layers.Dropout(0.1),
+        layers.Dense(64, activation='relu', kernel_regularizer=regularizers.l2(0.01)),  # L2 regularization
+        layers.Dropout(0.1),
+        layers.Dense(num_classes, activation='softmax')  # Jumlah kelas = 3 (babi, sapi, campuran)
+    ])
+
+    # Langkah 2: Kompilasi model
+    model.compile(optimizer='adam',
+                  loss='sparse_categorical_crossentropy',
+                  metrics=['accuracy'])
+    return model
+
+
+# Define identity block
+def identity_block(x, filters, stage, block):
+    conv_name_base = f'res{stage}{block}_branch'
+    bn_name_base = f'bn{stage}{block}_branch'
+
+    x_shortcut = x
+
+    x = Conv2D(filters, (3, 3), padding='same', name=f'{conv_name_base}2a')(x)
+    x = BatchNormalization(name=f'{bn_name_base}2a')(x)
+    x = ReLU()(x)
+
+    x = Conv2D(filters, (3, 3), padding='same', name=f'{conv_name_base}2b')(x)
+    x = BatchNormalization(name=f'{bn_name_base}2b')(x)
+
+    x = Add()([x, x_shortcut])
+    x = ReLU()(x)
+    x = BatchNormalization()(x)
+    return x
+
+
+# Define convolutional block
+def convolutional_block(x, filters, stage, block, strides=(2, 2)):
+    conv_name_base = f'res{stage}{block}_branch'
+    bn_name_base = f'bn{stage}{block}_branch'
+
+    x_shortcut = x
+
+    x = Conv2D(filters, (3, 3), padding='same', strides=strides, name=f'{conv_name_base}2a')(x)
+    x = BatchNormalization(name=f'{bn_name_base}2a')(x)
+    x = ReLU()(x)
+
+    x = Conv2D(filters, (3, 3), padding='same', name=f'{conv_name_base}2b')(x)
+    x = BatchNormalization(name=f'{bn_name_base}2b')(x)
+
+    x_shortcut = Conv2D(filters, (1, 1), strides=strides, name=f'{conv_name_base}1')(x_shortcut)
+    x_shortcut = BatchNormalization(name=f'{bn_name_base}1')(x_shortcut)
+
+    x = Add()([x, x_shortcut])
+    x = ReLU()(x)
+    x = BatchNormalization()(x)
+    return x
+
+
+# Build and compile the ResNet model used by RESNET 50
+def build_resnet(img_height, img_width, num_classes=3):
+    # Step 1: Define the ResNet architecture
+    input_tensor = Input(shape=(img_height, img_width, 3))
+
+    # Stage 1: 64x64
+    x = MaxPooling2D((2, 2))(input_tensor)
+    x = ReLU()(x)
+    x = BatchNormalization()(x)
+    x = Conv2D(64, (3, 3), padding='same')(x)
+
+    # Stage 2: 32x32
+    # Implement ResNet stages
+    # Stage 3: 16x16
+    x = identity_block(x, 64, stage=2, block='a')
+    x = identity_block(x, 64, stage=2, block='b')
+
+    # Stage 4: 8x8
+    x = convolutional_block(x, 128, stage=3, block='a')
+    x = identity_block(x, 128, stage=3, block='b')
+
+    # Stage 5: 4x4
+    x = convolutional_block(x, 256, stage=4, block='a')
+    x = identity_block(x, 256, stage=4, block='b')
+
+    # Stage 6: 1x1
+    x = AveragePooling2D((4, 4))(x)
+    x = Flatten()(x)
+    x = Dense(256, activation='relu')(x)
+    x = Dropout(0.5)(x)
+    output = Dense(num_classes, activation='softmax')(x)
+
+    # Create the model
+    model = Model(inputs=input_tensor, outputs=output)
+
+    # Step 2: Compile the model
+    model.compile(optimizer='adam',
+                  loss='categorical_crossentropy',
+                  metrics=['accuracy'])
+    return model
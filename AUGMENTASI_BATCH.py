@@ -0,0 +1,76 @@
+import numpy as np
+import tensorflow as tf
+
+# Urutan jenis augmentasi, sama seperti hasil AUGMENTASI CITRA.PY (gambar asli + 4 variasi)
+augmentation_types = ['original', 'rotate', 'shift', 'flip', 'zoom']
+
+# shift_image() menggeser 10 piksel pada foto resolusi penuh, sebelum di-resize ke ukuran model.
+# Di sini pergeseran dinyatakan sebagai fraksi lebar/tinggi, sehingga sama untuk semua imgsize.
+# Default = 10 piksel pada foto 640 x 480; untuk foto ukuran lain pakai (10 / lebar, 10 / tinggi)
+default_shift = (10 / 640, 10 / 480)
+
+
+# Fungsi untuk membuat matriks transformasi setiap jenis augmentasi
+# Parameter default mengikuti augment_image() di AUGMENTASI CITRA.PY; shift = fraksi (lebar, tinggi)
+# Hasil berupa matriks invers (piksel output -> piksel input) dalam format 8 nilai untuk ImageProjectiveTransformV3
+def augmentation_matrices(img_height, img_width, angle=45, shift=default_shift, zoom=0.8):
+    # rotate_image: matriks cv2.getRotationMatrix2D dengan pusat (W/2, H/2)
+    center_x, center_y = img_width / 2, img_height / 2
+    a, b = np.cos(np.deg2rad(angle)), np.sin(np.deg2rad(angle))
+    rotate = np.array([[a, b, (1 - a) * center_x - b * center_y],
+                       [-b, a, b * center_x + (1 - a) * center_y],
+                       [0, 0, 1]])
+
+    # shift_image: translasi sebesar (x, y) dikali ukuran gambar
+    translate = np.array([[1, 0, shift[0] * img_width],
+                          [0, 1, shift[1] * img_height],
+                          [0, 0, 1]])
+
+    # flip_image: cermin horizontal seperti cv2.flip(image, 1)
+    flip = np.array([[-1, 0, img_width - 1],
+                     [0, 1, 0],
+                     [0, 0, 1]])
+
+    # zoom_image: potongan tengah lalu resize, ditulis sebagai satu skala di sekitar pusat
+    centerX, centerY = int(img_width / 2), int(img_height / 2)
+    radiusX, radiusY = int(img_width / 2 * zoom), int(img_height / 2 * zoom)
+    scale_x, scale_y = 2 * radiusX / img_width, 2 * radiusY / img_height
+    zoom_inverse = np.array([[scale_x, 0, centerX - radiusX + 0.5 * scale_x - 0.5],
+                             [0, scale_y, centerY - radiusY + 0.5 * scale_y - 0.5],
+                             [0, 0, 1]])
+
+    inverses = [np.eye(3),
+                np.linalg.inv(rotate),
+                np.linalg.inv(translate),
+                np.linalg.inv(flip),
+                zoom_inverse]
+    return np.stack([m.reshape(-1)[:8] for m in inverses]).astype(np.float32)
+
+
+# Fungsi augmentasi untuk satu batch: setiap gambar mendapat satu jenis augmentasi secara acak,
+# lalu seluruh batch di-warp sekaligus dalam satu operasi
+def augment_batch(images, matrices, seed):
+    batch_size = tf.shape(images)[0]
+    choice = tf.random.stateless_uniform([batch_size], seed=seed, minval=0,
+                                         maxval=len(augmentation_types), dtype=tf.int32)
+    transforms = tf.gather(tf.constant(matrices), choice)
+    return tf.raw_ops.ImageProjectiveTransformV3(images=images,
+                                                 transforms=transforms,
+                                                 output_shape=tf.shape(images)[1:3],
+                                                 fill_value=0.0,
+                                                 interpolation='BILINEAR',
+                                                 fill_mode='CONSTANT')
+
+
+# Fungsi untuk menambahkan tahap augmentasi ke dataset tf.data yang sudah di-batch (gambar float32 0-255)
+# Seed yang sama menghasilkan augmentasi yang sama; setiap epoch mendapat augmentasi yang berbeda
+def augment_dataset(ds, seed=42, angle=45, shift=default_shift, zoom=0.8):
+    img_height, img_width = ds.element_spec[0].shape[1:3]
+    matrices = augmentation_matrices(img_height, img_width, angle, shift, zoom)
+    seeds = tf.data.Dataset.random(seed=seed, rerandomize_each_iteration=True).batch(2)
+
+    def augment(batch, batch_seed):
+        images, labels = batch
+        return augment_batch(images, matrices, batch_seed), labels
+
+    return tf.data.Dataset.zip((ds, seeds)).map(augment, num_parallel_calls=tf.data.AUTOTUNE, deterministic=True)
@@ -0,0 +1,220 @@
+import os
+import csv
+import json
+import uuid
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+from PIL import Image
+from tqdm import tqdm
+
+
+def _read_manifest(manifest_path):
+    manifest_dir = os.path.dirname(os.path.abspath(manifest_path))
+    with open(manifest_path, newline='') as f:
+        return [(os.path.join(manifest_dir, row['path']), row['label'], row['split']) for row in csv.DictReader(f)]
+
+
+# Fungsi untuk mendapatkan nama kelas sesuai indeks label
+# Folder: os.listdir(directory) seperti sebelumnya, manifest (PEMISAHAN DATASET.PY): label diurutkan
+def list_classes(directory):
+    if os.path.isfile(directory):
+        return sorted({label for _, label, _ in _read_manifest(directory)})
+    return os.listdir(directory)
+
+
+# Fungsi untuk mendaftar gambar dataset (tanpa membaca isi gambar)
+# directory dapat berupa folder kelas atau file manifest; split ('train'/'test') hanya dipakai untuk manifest
+# Urutan label mengikuti list_classes(directory), sama seperti class_names di skrip pelatihan
+def list_dataset(directory, split=None):
+    if os.path.isfile(directory):
+        rows = _read_manifest(directory)
+        classes = sorted({label for _, label, _ in rows})
+        rows = [row for row in rows if split is None or row[2] == split]
+        paths = [path for path, _, _ in rows]
+        labels = [classes.index(label) for _, label, _ in rows]
+        filenames = [os.path.basename(path) for path in paths]
+        return paths, labels, filenames, paths
+
+    paths = []
+    labels = []
+    filenames = []
+    keys = []
+    classes = os.listdir(directory)
+    for idx, class_name in enumerate(classes):
+        if class_name == '.DS_Store':
+            continue  # Ignore the .DS_Store folder
+        class_dir = os.path.join(directory, class_name)
+
+        # Mengabaikan folder .DS_Store
+        if not os.path.isdir(class_dir):
+            continue
+
+        for img_name in os.listdir(class_dir):
+            if img_name == '.DS_Store':
+                continue  # Ignore .DS_Store files
+
+            # Check if the label is valid (within the range [0, 2])
+            if 0 <= idx < 4:
+                paths.append(os.path.join(class_dir, img_name))
+                labels.append(idx)
+                filenames.append(img_name)  # Simpan nama file gambar
+                keys.append(f'{class_name}/{img_name}')
+            else:
+                print(f"Skipping image with invalid label: {img_name}")
+
+    return paths, labels, filenames, keys
+
+
+# Fungsi untuk membaca satu gambar dan menulisnya langsung ke array tujuan
+# fast_decode=True memakai draft() PIL: JPEG langsung diperkecil saat decode (hasil piksel sedikit berbeda)
+def decode_image(img_path, img_height, img_width, out, i, fast_decode=False):
+    img = Image.open(img_path)  # Read the image using PIL
+    if fast_decode:
+        img.draft('RGB', (img_width, img_height))
+    img = img.convert('RGB').resize((img_width, img_height))  # Resize the image to match the model
+    out[i] = np.asarray(img)
+
+
+# Decode PIL melepas GIL, sehingga thread pool cukup untuk memakai semua core
+# Setiap thread menulis ke baris array miliknya sendiri, urutan hasil sama dengan mode serial
+def _decode_all(paths, img_height, img_width, out, indices, desc, num_workers=1, fast_decode=False):
+    if num_workers is None:
+        num_workers = os.cpu_count() or 1
+    if num_workers <= 1:
+        for i in tqdm(indices, desc=desc):
+            decode_image(paths[i], img_height, img_width, out, i, fast_decode)
+        return
+
+    with ThreadPoolExecutor(max_workers=num_workers) as executor:
+        futures = [executor.submit(decode_image, paths[i], img_height, img_width, out, i, fast_decode)
+                   for i in indices]
+        for future in tqdm(futures, desc=desc):
+            future.result()
+
+
+# Kunci cache: direktori/manifest, split, resolusi dan mode decode. Perubahan file ditangani per file lewat index.json
+def _cache_path(cache_dir, directory, img_height, img_width, fast_decode=False, split=None):
+    key = f'{os.path.abspath(directory)}|{img_height}x{img_width}'
+    if split is not None and os.path.isfile(directory):
+        key += f'|{split}'
+    if fast_decode:
+        key += '|draft'
+    digest = hashlib.sha1(key.encode('utf-8')).hexdigest()[:16]
+    return os.path.join(cache_dir, f'{img_width}x{img_height}_{digest}')
+
+
+def _file_stamp(path):
+    st = os.stat(path)
+    return [st.st_mtime_ns, st.st_size]
+
+
+def _tmp_name(path):
+    root, ext = os.path.splitext(path)
+    return f'{root}.{os.getpid()}.{uuid.uuid4().hex[:8]}.tmp{ext}'
+
+
+# labels.npy dan index.json juga ditulis lewat file sementara; index.json terakhir agar cache baru dianggap
+# valid setelah semua file lengkap
+def _write_labels_and_index(cache_path, labels, index):
+    labels_file = os.path.join(cache_path, 'labels.npy')
+    tmp_file = _tmp_name(labels_file)
+    np.save(tmp_file, np.array(labels))
+    os.replace(tmp_file, labels_file)
+
+    index_file = os.path.join(cache_path, 'index.json')
+    tmp_file = _tmp_name(index_file)
+    with open(tmp_file, 'w') as f:
+        json.dump(index, f)
+    os.replace(tmp_file, index_file)
+
+
+# Fungsi untuk membuat/memperbarui cache dataset dalam bentuk .npy (uint8)
+# Hanya file yang baru atau berubah (mtime/ukuran berbeda) yang dibaca ulang
+def build_cache(directory, img_height, img_width, cache_dir, num_workers=1, fast_decode=False, split=None):
+    cache_path = _cache_path(cache_dir, directory, img_height, img_width, fast_decode, split)
+    os.makedirs(cache_path, exist_ok=True)
+    index_file = os.path.join(cache_path, 'index.json')
+    images_file = os.path.join(cache_path, 'images.npy')
+
+    paths, labels, filenames, keys = list_dataset(directory, split)
+    stamps = [_file_stamp(p) for p in paths]
+
+    old_index = None
+    if os.path.exists(index_file) and os.path.exists(images_file):
+        with open(index_file) as f:
+            old_index = json.load(f)
+
+    if old_index is not None and old_index['keys'] == keys and old_index['stamps'] == stamps:
+        # Cache masih valid, cukup perbarui label (urutan folder kelas bisa berubah)
+        if old_index['labels'] != labels:
+            old_index['labels'] = labels
+            _write_labels_and_index(cache_path, labels, old_index)
+        return cache_path
+
+    old_rows = {}
+    old_images = None
+    if old_index is not None:
+        old_images = np.load(images_file, mmap_mode='r')
+        for row, (key, stamp) in enumerate(zip(old_index['keys'], old_index['stamps'])):
+            old_rows[key] = (row, stamp)
+
+    # Tulis ke file sementara lalu ganti, agar cache lama tidak rusak jika proses terhenti
+    # Nama sementara unik per pemanggil, sehingga proses lain yang memperbarui cache yang sama tidak saling menimpa
+    tmp_file = _tmp_name(images_file)
+    images = np.lib.format.open_memmap(tmp_file, mode='w+', dtype=np.uint8,
+                                       shape=(len(paths), img_height, img_width, 3))
+    changed = []
+    for i, (key, stamp) in enumerate(zip(keys, stamps)):
+        old = old_rows.get(key)
+        if old is not None and old[1] == stamp:
+            images[i] = old_images[old[0]]
+        else:
+            changed.append(i)
+
+    _decode_all(paths, img_height, img_width, images, changed, f'Caching {os.path.basename(directory)}',
+                num_workers, fast_decode)
+    images.flush()
+    del images, old_images
+    os.replace(tmp_file, images_file)
+
+    _write_labels_and_index(cache_path, labels, {'directory': os.path.abspath(directory),
+                                                 'img_height': img_height,
+                                                 'img_width': img_width,
+                                                 'keys': keys,
+                                                 'stamps': stamps,
+                                                 'labels': labels,
+                                                 'filenames': filenames})
+    return cache_path
+
+
+# Fungsi untuk membuka cache dataset (memory-mapped, tanpa menyalin ke RAM)
+def load_cache(cache_path, with_filenames=False, mmap_mode='r'):
+    images = np.load(os.path.join(cache_path, 'images.npy'), mmap_mode=mmap_mode)
+    labels = np.load(os.path.join(cache_path, 'labels.npy'))
+    if with_filenames:
+        with open(os.path.join(cache_path, 'index.json')) as f:
+            filenames = json.load(f)['filenames']
+        return images, labels, filenames
+    return images, labels
+
+
+# Fungsi untuk membaca dataset dan mengabaikan folder .DS_Store dan file .DS_Store
+# Jika cache_dir diisi, hasil baca disimpan sebagai .npy dan dipakai ulang pada run berikutnya
+# num_workers mengatur jumlah thread decode (None = semua core)
+# directory juga dapat berupa manifest dari PEMISAHAN DATASET.PY, dengan split 'train' atau 'test'
+def read_dataset(directory, img_height, img_width, with_filenames=False, cache_dir=None,
+                 num_workers=1, fast_decode=False, split=None):
+    if cache_dir is not None:
+        cache_path = build_cache(directory, img_height, img_width, cache_dir, num_workers, fast_decode, split)
+        return load_cache(cache_path, with_filenames=with_filenames)
+
+    paths, labels, filenames, _ = list_dataset(directory, split)
+    images = np.empty((len(paths), img_height, img_width, 3), dtype=np.uint8)
+    _decode_all(paths, img_height, img_width, images, range(len(paths)), f'Reading {os.path.basename(directory)}',
+                num_workers, fast_decode)
+
+    if with_filenames:
+        return images, np.array(labels), filenames
+    else:
+        return images, np.array(labels)
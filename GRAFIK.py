@@ -1,6 +1,14 @@
+import os
 import matplotlib.pyplot as plt
 import pandas as pd
 
+# Tabel hasil dari SWEEP HYPERPARAMETER.PY; jika file tidak ada, data di bawah yang dipakai
+results_csv = r'F:V3\HASIL_SWEEP\hasil_sweep.csv'
+
+# Ukuran citra dan epoch yang ditampilkan pada grafik
+ukuran_citra = "50 X 50"
+epoch_grafik = 50
+
 # Data for the experiments
 data_specific = {
     "No": [1, 2, 3],
@@ -15,6 +23,19 @@ data_specific = {
 
 df_specific = pd.DataFrame(data_specific)
 
+if os.path.exists(results_csv):
+    df_sweep = pd.read_csv(results_csv)
+    # Trial yang dipangkas hanya dilatih sebagian epoch, sehingga tidak mewakili hasil pada epoch_grafik
+    df_sweep = df_sweep[df_sweep["Status"].isin(["selesai", "berhenti dini"])]
+    df_filtered = df_sweep[(df_sweep["Ukuran Citra (Pixel)"] == ukuran_citra) & (df_sweep["Epoch"] == epoch_grafik)]
+    df_filtered = df_filtered.dropna(subset=["Accuracy (%)"]).sort_values("Batch size")
+    if df_filtered.empty:
+        # Tidak ada konfigurasi yang mencapai epoch_grafik (mis. semua dipangkas), data bawaan tetap dipakai
+        print(f"Peringatan: {results_csv} tidak berisi hasil selesai untuk {ukuran_citra} dan epoch {epoch_grafik}, "
+              f"grafik memakai data bawaan")
+    else:
+        df_specific = df_filtered
+
 # Set different colors for each metric
 colors = {
     "Accuracy (%)": 'b',
@@ -35,7 +56,7 @@ for metric, color in colors.items():
 # Adding labels and title
 plt.xlabel("Batch Size")
 plt.ylabel("Percentage")
-plt.title("CNN Performance Metrics for 50 X 50 Pixel Image Size")
+plt.title(f"CNN Performance Metrics for {ukuran_citra} Pixel Image Size")
 plt.legend(loc='best')
 plt.xticks(df_specific["Batch size"])
 plt.grid(True)
@@ -0,0 +1,187 @@
+import os
+import numpy as np
+import tensorflow as tf
+import matplotlib.pyplot as plt
+from sklearn.metrics import confusion_matrix, precision_score, recall_score, f1_score, accuracy_score
+from ARSITEKTUR_MODEL import build_cnn
+from PIPELINE_DATASET import stream_dataset, stream_cache, stream_arrays
+
+
+# Dijalankan sekali di setiap proses worker, sebelum TensorFlow membuat thread pool-nya
+def configure_threads(intra_op_threads, inter_op_threads):
+    tf.config.threading.set_intra_op_parallelism_threads(intra_op_threads)
+    tf.config.threading.set_inter_op_parallelism_threads(inter_op_threads)
+
+
+# Array dapat dikirim langsung (mode serial) atau sebagai path .npy yang dibuka dengan memory-map (mode paralel)
+def _open(array):
+    if isinstance(array, str):
+        return np.load(array, mmap_mode='r')
+    return array
+
+
+# Fungsi untuk melatih dan mengevaluasi satu fold, lalu menyimpan hasilnya ke folder fold tersebut
+# data = (train_images, train_labels, test_images, test_labels), gambar dalam uint8
+# Di worker paralel gambar berupa path .npy; data dibaca per batch dari memmap agar tidak ada salinan float32 per worker
+def train_fold(fold, train_index, val_index, data, settings):
+    shared = isinstance(data[0], str)
+    train_images, train_labels, test_images, test_labels = [_open(array) for array in data]
+    img_height, img_width = settings['img_height'], settings['img_width']
+    batchsize = settings['batchsize']
+    class_names = settings['class_names']
+    test_filenames = settings['test_filenames']
+
+    print(f'\nTraining Fold {fold}...')
+    model = build_cnn(img_height, img_width, kernel_size=(5, 5))
+
+    # Langkah 3: Latih model menggunakan data pelatihan dan validasi
+    # Normalisasi nilai piksel gambar ke rentang [0, 1] hanya untuk data pelatihan
+    if settings['streaming']:
+        # Cache sudah dibuat oleh proses utama, sehingga worker paralel hanya membacanya
+        if settings['train_cache'] is not None:
+            train_ds = stream_cache(settings['train_cache'], batchsize, train_index, shuffle=True, seed=42, augment=settings['augmentasi'])
+            val_ds = stream_cache(settings['train_cache'], batchsize, val_index)
+        else:
+            train_ds = stream_dataset(settings['train_dir'], img_height, img_width, batchsize, indices=train_index, augment=settings['augmentasi'], seed=42, split='train')
+            val_ds = stream_dataset(settings['train_dir'], img_height, img_width, batchsize, indices=val_index, shuffle=False, split='train')
+        history = model.fit(train_ds, epochs=settings['epoch'], verbose=1, validation_data=val_ds)
+    elif shared:
+        train_ds = stream_arrays(train_images, train_labels, batchsize, train_index, shuffle=True, seed=42)
+        val_ds = stream_arrays(train_images, train_labels, batchsize, val_index)
+        history = model.fit(train_ds, epochs=settings['epoch'], verbose=1, validation_data=val_ds)
+    else:
+        X_train = train_images[train_index].astype('float32') / 255.0
+        X_val = train_images[val_index].astype('float32') / 255.0
+        y_train, y_val = train_labels[train_index], train_labels[val_index]
+        history = model.fit(X_train, y_train, epochs=settings['epoch'], batch_size=batchsize, verbose=1, validation_data=(X_val, y_val))
+        del X_train, X_val
+
+    # Langkah 4: Evaluasi model menggunakan data pengujian
+    # Satu kali prediksi dipakai untuk loss/akurasi pengujian sekaligus metrik sklearn
+    # Tidak melakukan normalisasi pada data pengujian
+    if settings['streaming']:
+        if settings['test_cache'] is not None:
+            test_ds = stream_cache(settings['test_cache'], batchsize, normalize=False)
+        else:
+            test_ds = stream_dataset(settings['test_dir'], img_height, img_width, batchsize, shuffle=False, normalize=False, split='test')
+        predictions = model.predict(test_ds)
+    elif shared:
+        predictions = model.predict(stream_arrays(test_images, test_labels, batchsize, normalize=False))
+    else:
+        test_images = test_images.astype('float32')
+        predictions = model.predict(test_images, batch_size=batchsize)
+    predicted_labels = np.argmax(predictions, axis=1)
+    test_loss = float(np.mean(tf.keras.losses.sparse_categorical_crossentropy(test_labels, predictions)) + sum(float(loss) for loss in model.losses))
+    test_accuracy = accuracy_score(test_labels, predicted_labels)
+    print(f'Test loss: {test_loss:.4f}')
+    print(f'Test accuracy: {test_accuracy * 100:.2f}%')
+
+    # Setelah pelatihan selesai, mencetak akurasi validasi
+    validation_loss = history.history['val_loss']
+    print(f'Validation loss: {validation_loss[-1]:.4f}')
+
+    validation_accuracy = history.history['val_accuracy'][-1]
+    print(f'Validation accuracy: {validation_accuracy * 100:.2f}%')
+
+    # Konversi indeks label kelas menjadi nama kelas (jenis daging)
+    predicted_class_names = [class_names[label_idx] for label_idx in predicted_labels]
+
+    # EVALUASI 4 KATEGORI
+    # Hitung confusion matrix
+    conf_matrix = confusion_matrix(test_labels, predicted_labels)
+
+    # Hitung presisi
+    precision = precision_score(test_labels, predicted_labels, average='macro')
+
+    # Hitung recall
+    recall = recall_score(test_labels, predicted_labels, average='macro')
+
+    # Hitung F1 score
+    f1 = f1_score(test_labels, predicted_labels, average='macro')
+
+    # Hitung akurasi
+    accuracy = test_accuracy
+
+    # Hitung jumlah data yang benar-benar cocok (true predictions)
+    true_predictions = np.sum(np.diag(conf_matrix))
+
+    # Simpan hasil perhitungan metrik evaluasi dalam file teks
+    num_epochs = len(history.epoch)
+    output_folder_name = f'{img_width}x{img_height}_{num_epochs}Epoch_{fold}'
+    output_folder_path = os.path.join(settings['main_output_folder_path'], output_folder_name)
+
+    if not os.path.exists(output_folder_path):
+        os.makedirs(output_folder_path)
+
+    # Simpan hasil training ke dalam file teks
+    with open(os.path.join(output_folder_path, f'hasil_training_{img_width}x{img_height}_{num_epochs}_Epoch_Fold{fold}.txt'), 'w') as output_file:
+        output_file.write(f'History: {history.history}\n')
+        output_file.write(f'Image Width: {img_width}\n')
+        output_file.write(f'Image Height: {img_height}\n')
+        output_file.write(f'Number of Epochs: {num_epochs}\n')
+        output_file.write(f'Batch Size: {batchsize}\n')
+        output_file.write(f'Training loss: {history.history["loss"][-1]:.4f}\n')
+        output_file.write(f'Training accuracy: {history.history["accuracy"][-1] * 100:.2f}%\n')
+        output_file.write(f'Validation loss: {validation_loss[-1]:.4f}\n')
+        output_file.write(f'Validation accuracy: {validation_accuracy * 100:.2f}%\n')
+
+    # Simpan hasil perhitungan metrik evaluasi dalam file teks
+    with open(os.path.join(output_folder_path, f'matriks_{img_width}x{img_height}_{num_epochs}_Epoch_Fold{fold}.txt'), 'w') as output_file:
+        output_file.write(f'Confusion Matrix:\n{conf_matrix}\n')
+        output_file.write(f'Akurasi : {accuracy * 100:.2f}%\n')
+        output_file.write(f'Presisi : {precision * 100 :.2f}%\n')
+        output_file.write(f'Recall: {recall * 100:.2f}%\n')
+        output_file.write(f'F1 Score: {f1 * 100:.2f}%\n')
+        output_file.write(f'True Predictions: {true_predictions}\n')
+
+        for i, class_name in enumerate(class_names):
+            output_file.write(f'{class_name}:\n')
+            output_file.write(f'  True Positives: {conf_matrix[i, i]}\n')
+            output_file.write(f'  False Positives: {np.sum(conf_matrix[i, :]) - conf_matrix[i, i]}\n')
+            output_file.write(f'  False Negatives: {np.sum(conf_matrix[:, i]) - conf_matrix[i, i]}\n')
+            output_file.write(f'  True Negatives: {np.sum(conf_matrix) - np.sum(conf_matrix[i, :]) - np.sum(conf_matrix[:, i]) + conf_matrix[i, i]}\n')
+
+    # Cetak nama gambar, jenis daging, dan akurasi untuk setiap gambar dalam data pengujian
+    with open(os.path.join(output_folder_path, f'hasil_test_{img_width}x{img_height}_{num_epochs}_Epoch_Fold{fold}.txt'), 'w') as output_file:
+        output_file.write("Image Name, True Class, Predicted Class\n")
+        for i in range(len(test_labels)):
+            image_name = test_filenames[i]
+            true_class = class_names[test_labels[i]]
+            predicted_class = predicted_class_names[i]
+            output_file.write(f"{image_name}, {true_class}, {predicted_class}\n")
+
+    # Simpan model ke dalam file .h5
+    model.save(os.path.join(output_folder_path, f'model_daging{img_width}x{img_height}_{num_epochs}_Epoch_Fold{fold}.keras'))
+
+    # Visualisasi akurasi dan loss selama pelatihan
+    plt.figure(figsize=(12, 4))
+
+    # Akurasi pelatihan dan validasi
+    plt.subplot(1, 2, 1)
+    plt.plot(history.history['accuracy'], label='Training Accuracy')
+    plt.plot(history.history['val_accuracy'], label='Validation Accuracy')
+    plt.xlabel('Epoch')
+    plt.ylabel('Accuracy (%)')
+    plt.legend()
+    plt.tight_layout()
+
+    # Loss pelatihan dan validasi
+    plt.subplot(1, 2, 2)
+    plt.plot(history.history['loss'], label='Training Loss')
+    plt.plot(history.history['val_loss'], label='Validation Loss')
+    plt.xlabel('Epoch')
+    plt.ylabel('Loss')
+    plt.legend()
+
+    plt.tight_layout()
+    # Simpan gambar grafik
+    plt.savefig(os.path.join(output_folder_path, f'grafik_training_{img_width}x{img_height}_{num_epochs}_Epoch_Fold{fold}.png'))
+    plt.close()
+
+    return {'fold': fold,
+            'epochs': num_epochs,
+            'test_loss': test_loss,
+            'accuracy': accuracy,
+            'precision': precision,
+            'recall': recall,
+            'f1': f1}
@@ -0,0 +1,124 @@
+import hashlib
+import numpy as np
+import tensorflow as tf
+from BACA_DATASET import list_dataset, build_cache, load_cache
+from AUGMENTASI_BATCH import augment_dataset
+
+AUTOTUNE = tf.data.AUTOTUNE
+
+
+# Fungsi untuk membaca dan mengubah ukuran satu gambar di dalam pipeline tf.data (hasil uint8)
+def _load_image(path, img_height, img_width):
+    img = tf.io.decode_image(tf.io.read_file(path), channels=3, expand_animations=False)
+    img = tf.image.resize(img, (img_height, img_width), method='bicubic', antialias=True)
+    return tf.cast(tf.clip_by_value(tf.round(img), 0, 255), tf.uint8)
+
+
+# Normalisasi (dan augmentasi jika diaktifkan) dilakukan per batch,
+# sehingga dataset tidak pernah disimpan sebagai float32 seluruhnya
+def _finish(ds, num_classes, normalize, augment=False, seed=None):
+    ds = ds.map(lambda images, labels: (tf.cast(images, tf.float32), labels), num_parallel_calls=AUTOTUNE)
+    if augment:
+        ds = augment_dataset(ds, seed=42 if seed is None else seed)
+
+    def convert(images, labels):
+        if normalize:
+            images = images / 255.0
+        if num_classes is not None:
+            labels = tf.one_hot(labels, num_classes)
+        return images, labels
+
+    return ds.map(convert, num_parallel_calls=AUTOTUNE).prefetch(AUTOTUNE)
+
+
+# Dataset dari daftar file: decode dan resize paralel dengan num_parallel_calls
+# Tanpa cache_file, setiap epoch decode dan resize ulang semua gambar (cara yang disarankan untuk menghindarinya
+# adalah cache .npy lewat cache_dir di stream_dataset). cache_file menyimpan hasil resize dengan ds.cache():
+# '' = di memori, path = file cache tf.data. Pengacakan lalu dilakukan setelah cache pada gambar hasil resize
+def stream_files(paths, labels, img_height, img_width, batch_size, shuffle=False, seed=None,
+                 num_classes=None, normalize=True, augment=False, cache_file=None):
+    ds = tf.data.Dataset.from_tensor_slices((np.asarray(paths, dtype=str), np.asarray(labels, dtype=np.int64)))
+    if shuffle and cache_file is None:
+        ds = ds.shuffle(len(paths), seed=seed, reshuffle_each_iteration=True)
+    ds = ds.map(lambda path, label: (_load_image(path, img_height, img_width), label),
+                num_parallel_calls=AUTOTUNE, deterministic=True)
+    if cache_file is not None:
+        ds = ds.cache(cache_file)
+        if shuffle:
+            ds = ds.shuffle(len(paths), seed=seed, reshuffle_each_iteration=True)
+    return _finish(ds.batch(batch_size), num_classes, normalize, augment, seed)
+
+
+# Dataset dari cache .npy (BACA_DATASET): hanya indeks yang diacak, gambar diambil per batch dari memmap
+def stream_cache(cache_path, batch_size, indices=None, shuffle=False, seed=None,
+                 num_classes=None, normalize=True, augment=False):
+    images, labels = load_cache(cache_path)
+    return stream_arrays(images, labels, batch_size, indices, shuffle, seed, num_classes, normalize, augment)
+
+
+# Dataset dari array uint8 (mis. memmap .npy bersama di worker K-Fold), diambil per batch tanpa menyalin seluruh array
+def stream_arrays(images, labels, batch_size, indices=None, shuffle=False, seed=None,
+                  num_classes=None, normalize=True, augment=False):
+    labels = np.asarray(labels)
+    if indices is None:
+        indices = np.arange(len(labels))
+    _, img_height, img_width, channels = images.shape
+
+    def gather(idx):
+        return images[idx], labels[idx].astype(np.int64)
+
+    def load_batch(idx):
+        batch_images, batch_labels = tf.numpy_function(gather, [idx], (tf.uint8, tf.int64))
+        batch_images.set_shape((None, img_height, img_width, channels))
+        batch_labels.set_shape((None,))
+        return batch_images, batch_labels
+
+    ds = tf.data.Dataset.from_tensor_slices(np.asarray(indices, dtype=np.int64))
+    if shuffle:
+        ds = ds.shuffle(len(indices), seed=seed, reshuffle_each_iteration=True)
+    ds = ds.batch(batch_size).map(load_batch, num_parallel_calls=AUTOTUNE, deterministic=True)
+    return _finish(ds, num_classes, normalize, augment, seed)
+
+
+# Pembagian validasi seperti validation_split pada model.fit: bagian akhir data menjadi validasi
+def split_validation(indices, validation_split):
+    split_at = int(np.floor(len(indices) * (1.0 - validation_split)))
+    return indices[:split_at], indices[split_at:]
+
+
+# Fungsi utama: dataset streaming dari folder kelas atau dari cache .npy (jika cache_dir diisi)
+# Tanpa cache_dir, gambar di-decode ulang setiap epoch kecuali cache_file diisi ('' = memori, path = file
+# cache tf.data, nama file ditambah ukuran dan hash indeks agar setiap subset/fold punya cache sendiri)
+# indices memilih subset data (mis. fold K-Fold); validation_split mengembalikan (train_ds, val_ds)
+# augment=True menerapkan augmentasi AUGMENTASI_BATCH pada data pelatihan saja
+# directory juga dapat berupa manifest dari PEMISAHAN DATASET.PY, dengan split 'train' atau 'test'
+def stream_dataset(directory, img_height, img_width, batch_size, indices=None, validation_split=None,
+                   shuffle=True, seed=None, num_classes=None, normalize=True, cache_dir=None, num_workers=1,
+                   augment=False, split=None, cache_file=None):
+    if cache_dir is not None:
+        cache_path = build_cache(directory, img_height, img_width, cache_dir, num_workers, split=split)
+        num_samples = len(load_cache(cache_path)[1])
+    else:
+        paths, labels, _, _ = list_dataset(directory, split)
+        paths, labels = np.array(paths), np.array(labels)
+        num_samples = len(labels)
+
+    if indices is None:
+        indices = np.arange(num_samples)
+
+    def make(subset, subset_shuffle, subset_augment):
+        if cache_dir is not None:
+            return stream_cache(cache_path, batch_size, subset, subset_shuffle, seed, num_classes, normalize,
+                                subset_augment)
+        subset_cache = cache_file
+        if cache_file:
+            digest = hashlib.sha1(np.asarray(subset, dtype=np.int64).tobytes()).hexdigest()[:12]
+            subset_cache = f'{cache_file}_{img_height}x{img_width}_{digest}'
+        return stream_files(paths[subset], labels[subset], img_height, img_width, batch_size,
+                            subset_shuffle, seed, num_classes, normalize, subset_augment, subset_cache)
+
+    if validation_split is None:
+        return make(indices, shuffle, augment)
+
+    train_indices, val_indices = split_validation(np.asarray(indices), validation_split)
+    return make(train_indices, shuffle, augment), make(val_indices, False, False)